@@ -1,13 +1,16 @@
 from dataclasses import dataclass
+from typing import Union
 
+import numpy as np
 import pandas as pd
 
+from _projection_kernel import annual_growth, simulate
 from housing import HousingStrategy, MortgageStrategy, PresellingStrategy, RentStrategy
 from investment import InvestmentStrategy, RiskAdjustedStrategy
 from visualizer import Plots, Print
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FinancialStrategy:
     """Combines housing and investment strategies with allocation rates."""
 
@@ -35,6 +38,7 @@ class BudgetCalculator:
         other_income: float,
         daily_living_expenses: float,
         other_expenses: float,
+        verbose: bool = False,
     ) -> None:
         self.financial_strategy = financial_strategy
         self.salary = salary
@@ -42,8 +46,9 @@ class BudgetCalculator:
         self.daily_living_expense = daily_living_expenses
         self.other_expenses = other_expenses
 
-        Print.print_dict("Starting Parameters", self.__dict__)
-        print()
+        if verbose:
+            Print.print_dict("Starting Parameters", self.__dict__)
+            print()
 
     def calculate_total_income(self) -> float:
         return self.salary + self.other_income
@@ -71,97 +76,84 @@ class BudgetCalculator:
         income_increase: float,
         expense_increase: float,
         house_value_increase: float,
-    ) -> pd.DataFrame:
-        start = {
-            "savings": savings,
-            "investments": investments,
-            "liabilities": liabilities,
-            "months": months,
-            "income_increase": income_increase,
-            "expense_increase": expense_increase,
-            "house_value_increase": house_value_increase,
-        }
+        dtype: type = np.float64,
+        return_raw: bool = False,
+        verbose: bool = False,
+    ) -> Union[pd.DataFrame, dict[str, np.ndarray]]:
+        if verbose:
+            start = {
+                "savings": savings,
+                "investments": investments,
+                "liabilities": liabilities,
+                "months": months,
+                "income_increase": income_increase,
+                "expense_increase": expense_increase,
+                "house_value_increase": house_value_increase,
+            }
+            Print.print_dict("Financial Projection Seed", start)
+            print()
+
+        return self._vectorized_projection(
+            savings=savings,
+            investments=investments,
+            liabilities=liabilities,
+            months=months,
+            income_increase=income_increase,
+            expense_increase=expense_increase,
+            house_value_increase=house_value_increase,
+            dtype=dtype,
+            return_raw=return_raw,
+        )
 
-        Print.print_dict("Financial Projection Seed", start)
-        print()
+    def _vectorized_projection(
+        self,
+        savings: float,
+        investments: float,
+        liabilities: float,
+        months: int,
+        income_increase: float,
+        expense_increase: float,
+        house_value_increase: float,
+        dtype: type = np.float64,
+        return_raw: bool = False,
+    ) -> Union[pd.DataFrame, dict[str, np.ndarray]]:
+        strategy = self.financial_strategy
+        housing = strategy.housing_strategy
+
+        # Housing costs only depend on the strategy, so build them up front
+        housing_costs = housing.cost_schedule(
+            months, house_value_increase, expense_increase
+        )
+        house_values = housing.house_value * annual_growth(house_value_increase, months)
 
-        net_worth_values = []
-        savings_values = []
-        liabilities_values = []
-        house_values = []
-        investments_values = []
-        investment_returns = []
-        housing_costs = []
-        cashflow_values = []
-
-        housing = self.financial_strategy.housing_strategy
-        is_owned = isinstance(housing, (MortgageStrategy, PresellingStrategy))
-        is_rented = isinstance(housing, RentStrategy)
-
-        for month in range(1, months + 1):
-            # Increase income and expenses annually
-            if month % 12 == 1 and month > 1:
-                self.increase_income(pct=income_increase)
-                self.increase_expense(pct=expense_increase)
-
-                # Update house value or rent
-                if is_owned:
-                    housing.increase_house_value(house_value_increase)
-                elif is_rented:
-                    housing.increase_rent(expense_increase)
-
-            # Update housing costs
-            if isinstance(housing, (MortgageStrategy, PresellingStrategy)):
-                housing.set_ammortization()
-                housing.set_yearly_cost()
-
-            # Calculate monthly budget
-            budget = self.calculate_budget()
-
-            # Calculate investment returns
-            investment_return = (
-                self.financial_strategy.investment_strategy.calculate_monthly_return(
-                    investments
-                )
-            )
-            investments += investment_return
-
-            # Allocate budget
-            if budget >= 0:
-                savings += budget * self.financial_strategy.savings_rate
-                investments += budget * self.financial_strategy.investments_rate
-            else:
-                # Handle negative budget by drawing from investments
-                investments += budget
-
-            # Get house value if applicable
-            house_value = housing.house_value if is_owned else 0
-
-            # Record values
-            cashflow_values.append(budget)
-            investments_values.append(investments)
-            investment_returns.append(investment_return)
-            savings_values.append(savings)
-            liabilities_values.append(liabilities)
-            house_values.append(house_value)
-            housing_costs.append(housing.calculate_housing_cost())
-            net_worth_values.append(savings + investments - liabilities + house_value)
-
-        df = pd.DataFrame(
-            {
-                "net_worth": net_worth_values,
-                "house_value": house_values,
-                "housing_cost": housing_costs,
-                "cashflow": cashflow_values,
-                "investments": investments_values,
-                "investment_returns": investment_returns,
-                "savings": savings_values,
-                "liabilities": liabilities_values,
-            },
-            index=[i for i in range(1, months + 1)],
+        # Income and expenses grow once a year
+        income = self.calculate_total_income() * annual_growth(income_increase, months)
+        expenses = (self.daily_living_expense + self.other_expenses) * annual_growth(
+            expense_increase, months
+        )
+
+        columns = simulate(
+            income=income,
+            expenses=expenses,
+            housing_costs=housing_costs,
+            house_values=house_values,
+            savings=savings,
+            investments=investments,
+            liabilities=liabilities,
+            monthly_return_rate=strategy.investment_strategy.get_monthly_return_rate(),
+            savings_rate=strategy.savings_rate,
+            investments_rate=strategy.investments_rate,
         )
 
-        return df
+        if return_raw:
+            return {
+                name: values.astype(dtype, copy=False)
+                for name, values in columns.items()
+            }
+
+        return pd.DataFrame(
+            columns, index=pd.RangeIndex(1, months + 1, name="month"), dtype=dtype
+        )
 
     def analyze_projection(self, projection: pd.DataFrame):
         stats = {
@@ -184,13 +176,20 @@ class BudgetCalculator:
             projection.iloc[-1],
             sep="\n",
         )
-        print(
-            f"\nCashflow Distribution:\n{projection.cashflow.value_counts().sort_index()}"
-        )
-        print(f"\nNegative Value Months:\n{projection[(projection < 0).any(axis=1)]}")
+        print(f"\nCashflow Distribution:\n{projection.cashflow.describe()}")
+
+        signed_columns = [
+            "net_worth",
+            "cashflow",
+            "investments",
+            "investment_returns",
+            "savings",
+        ]
+        negative_months = (projection[signed_columns] < 0).any(axis=1)
+        print(f"\nNegative Value Months:\n{projection[negative_months]}")
 
 
-def main():
+def main(verbose: bool = False):
     # Sample parameters
     SALARY = 143000
     OTHER_INCOME = 0
@@ -225,6 +224,7 @@ def main():
         loan_interest_rate=HOUSING_LOAN_INTEREST,
         property_tax_rate=PROPERTY_TAX_RATE,
         maintenance_cost_rate=MAINTENANCE_COST_RATE,
+        verbose=verbose,
     )
 
     preselling_strategy = PresellingStrategy(
@@ -236,9 +236,10 @@ def main():
         loan_interest_rate=HOUSING_LOAN_INTEREST,
         property_tax_rate=PROPERTY_TAX_RATE,
         maintenance_cost_rate=MAINTENANCE_COST_RATE,
+        verbose=verbose,
     )
 
-    rent_strategy = RentStrategy(rent=50000)
+    rent_strategy = RentStrategy(rent=50000, verbose=verbose)
 
     def run_financial_projection(housing_strategy):
         # Create investment strategy (example using risk-adjusted)
@@ -262,6 +263,7 @@ def main():
             other_income=OTHER_INCOME,
             daily_living_expenses=DAILY_LIVING_EXPENSE,
             other_expenses=OTHER_EXPENSE,
+            verbose=verbose,
         )
 
         # Calculate projection
@@ -273,10 +275,12 @@ def main():
             income_increase=INCOME_INCREASE,
             expense_increase=EXPENSE_INCREASE,
             house_value_increase=HOUSE_VALUE_INCREASE,
+            verbose=verbose,
         )
 
         # Analyze results
-        calculator.analyze_projection(projection)
+        if verbose:
+            calculator.analyze_projection(projection)
 
         # Plot results
         Plots.plot_net_worth(projection)
@@ -287,4 +291,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(verbose=True)
@@ -0,0 +1,74 @@
+import numpy as np
+
+
+def annual_growth(rate: float, months: int) -> np.ndarray:
+    """Monthly multipliers for a rate that compounds once a year."""
+    yearly = (1 + rate) ** np.arange((months - 1) // 12 + 1)
+    return yearly[np.arange(months) // 12]
+
+
+def run_scan(
+    budget: np.ndarray,
+    monthly_return_rate: float,
+    savings_rate: float,
+    investments_rate: float,
+    savings: float,
+    investments: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Allocate a monthly budget series into savings and compounding investments."""
+    surplus = np.where(budget >= 0, budget, 0)
+    allocations = np.where(budget >= 0, budget * investments_rate, budget)
+    savings_values = savings + np.cumsum(surplus * savings_rate)
+
+    # inv[m] = inv[m - 1] * growth + allocation[m], solved with a discounted cumsum
+    compounding = np.exp(np.arange(1, len(budget) + 1) * np.log1p(monthly_return_rate))
+    investments_values = compounding * (
+        investments + np.cumsum(allocations / compounding)
+    )
+
+    previous_investments = np.concatenate(([investments], investments_values[:-1]))
+    investment_returns = previous_investments * monthly_return_rate
+
+    return savings_values, investments_values, investment_returns
+
+
+def simulate(
+    income: np.ndarray,
+    expenses: np.ndarray,
+    housing_costs: np.ndarray,
+    house_values: np.ndarray,
+    savings: float,
+    investments: float,
+    liabilities: float,
+    monthly_return_rate: float,
+    savings_rate: float,
+    investments_rate: float,
+) -> dict[str, np.ndarray]:
+    """Project monthly cashflow, savings, investments and net worth."""
+    cashflow = income - expenses - housing_costs
+
+    # Allocate budget, drawing from investments when it is negative
+    savings_values, investments_values, investment_returns = run_scan(
+        budget=cashflow,
+        monthly_return_rate=monthly_return_rate,
+        savings_rate=savings_rate,
+        investments_rate=investments_rate,
+        savings=savings,
+        investments=investments,
+    )
+
+    liabilities_values = np.full(len(cashflow), liabilities, dtype=float)
+    net_worth_values = (
+        savings_values + investments_values - liabilities_values + house_values
+    )
+
+    return {
+        "net_worth": net_worth_values,
+        "house_value": house_values,
+        "housing_cost": housing_costs,
+        "cashflow": cashflow,
+        "investments": investments_values,
+        "investment_returns": investment_returns,
+        "savings": savings_values,
+        "liabilities": liabilities_values,
+    }
@@ -1,10 +1,11 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Optional
+from dataclasses import InitVar, dataclass, field, fields
 
+import numpy as np
 import pandas as pd
 
-from interest import calculate_ammortization_schedule
+from _projection_kernel import annual_growth
+from interest import calculate_ammortization_schedule, calculate_monthly_payment
 from visualizer import Print
 
 pd.options.display.float_format = "{:,.2f}".format
@@ -13,12 +14,33 @@ pd.options.display.float_format = "{:,.2f}".format
 class HousingStrategy(ABC):
     """Abstract base class for housing strategies."""
 
+    __slots__ = ()
+
     name = "Default"
 
     @abstractmethod
     def calculate_housing_cost(self) -> float:
         pass
 
+    @abstractmethod
+    def update_annual(self, house_value_increase: float, rent_increase: float):
+        pass
+
+    @abstractmethod
+    def step_month(self):
+        pass
+
+    @abstractmethod
+    def cost_schedule(
+        self, months: int, house_value_increase: float, rent_increase: float
+    ) -> np.ndarray:
+        pass
+
+    def print_values(self) -> None:
+        values = {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+        Print.print_dict("Housing Values", {**values, "name": self.name})
+        print()
+
     def __str__(self) -> str:
         return f"{self.name}"
 
@@ -26,33 +48,50 @@ class HousingStrategy(ABC):
         return format(str(self), format_spec)
 
 
-@dataclass
-class MortgageStrategy(HousingStrategy):
-    """Concrete strategy for owning with mortgage."""
+@dataclass(slots=True)
+class OwnerStrategy(HousingStrategy):
+    """Shared behaviour for strategies that end with owning the house."""
 
-    house_value: float
-    down_payment: float
-    loan_term_months: int
-    loan_interest_rate: float
-    property_tax_rate: float
-    maintenance_cost_rate: float
+    # Month the house is turned over and property costs start
+    turnover_month = 0
 
     # Non-init fields
     month: int = field(init=False, default=0)
-    owned: bool = field(init=False, default=True)
+    owned: bool = field(init=False, default=False)
     ammortization: float = field(init=False, default=0)
     property_tax: float = field(init=False, default=0)
     maintenance_cost: float = field(init=False, default=0)
     principal: float = field(init=False, default=0)
-    ammortization_schedule: Optional[pd.DataFrame] = field(init=False, default=None)
+    monthly_payment: float = field(init=False, default=0)
+    housing_cost: float = field(init=False, default=0)
+    ammortization_plan: np.ndarray = field(init=False, default=None, repr=False)
+    verbose: InitVar[bool] = field(default=False, kw_only=True)
 
-    def __post_init__(self):
-        self.name = "Mortgage"
-        Print.print_dict("Housing Values", self.__dict__)
-        print()
+    def __post_init__(self, verbose: bool):
+        self.owned = self.turnover_month == 0
+
+        # The loan is fixed by the purchase terms, not the appreciated value
+        self.principal = self.loan_principal()
+        self.create_ammortization_schedule()
+
+        if verbose:
+            self.print_values()
+
+    @abstractmethod
+    def loan_principal(self) -> float:
+        """Amount financed by the bank loan at purchase."""
+
+    @property
+    @abstractmethod
+    def payment_months(self) -> int:
+        """Number of months until the last loan payment, inclusive."""
+
+    @abstractmethod
+    def ammortization_array(self, months: int) -> np.ndarray:
+        pass
 
     def calculate_housing_cost(self) -> float:
-        return self.ammortization + self.property_tax + self.maintenance_cost
+        return self.housing_cost
 
     def set_yearly_cost(self):
         if self.owned:
@@ -62,110 +101,158 @@ class MortgageStrategy(HousingStrategy):
             self.property_tax = 0
             self.maintenance_cost = 0
 
+        self.housing_cost = (
+            self.ammortization + self.property_tax + self.maintenance_cost
+        )
+
+    @property
+    def ammortization_schedule(self) -> pd.DataFrame:
+        return calculate_ammortization_schedule(
+            principal=self.principal,
+            annual_rate=self.loan_interest_rate,
+            years=self.loan_term_months / 12,
+        )
+
     def create_ammortization_schedule(self) -> None:
-        self.ammortization_schedule = calculate_ammortization_schedule(
+        self.monthly_payment = calculate_monthly_payment(
             principal=self.principal,
             annual_rate=self.loan_interest_rate,
             years=self.loan_term_months / 12,
         )
 
     def set_ammortization(self):
-        if self.month > self.loan_term_months:
+        if self.month == 0:
+            self.ammortization_plan = self.ammortization_array(self.payment_months)
+
+        if self.month < len(self.ammortization_plan):
+            self.ammortization = float(self.ammortization_plan[self.month])
+        else:
             self.ammortization = 0
-        elif self.month == 0:
-            self.ammortization = self.down_payment
-            self.principal = self.house_value - self.down_payment
-            self.create_ammortization_schedule()
+
+        if self.month == self.turnover_month:
             self.owned = True
-        elif self.month > 0:
-            self.ammortization = self.ammortization_schedule.monthly_payment[0]
+            self.set_yearly_cost()
 
+        self.housing_cost = (
+            self.ammortization + self.property_tax + self.maintenance_cost
+        )
         self.month += 1
 
     def increase_house_value(self, percentage: float):
         self.house_value += self.house_value * percentage
 
+    def update_annual(self, house_value_increase: float, rent_increase: float):
+        self.increase_house_value(house_value_increase)
+        self.set_yearly_cost()
+
+    def step_month(self):
+        self.set_ammortization()
+
+    def cost_schedule(
+        self, months: int, house_value_increase: float, rent_increase: float
+    ) -> np.ndarray:
+        ammortization = self.ammortization_array(months)
+        month = np.arange(months)
+
+        # Property tax and maintenance start once the house is turned over
+        house_values = self.house_value * annual_growth(house_value_increase, months)
+        yearly_cost = np.where(
+            month >= self.turnover_month,
+            house_values * (self.property_tax_rate + self.maintenance_cost_rate) / 12,
+            0,
+        )
+
+        return ammortization + yearly_cost
 
-@dataclass
-class PresellingStrategy(HousingStrategy):
-    """Concrete strategy for owning with preselling."""
+
+@dataclass(slots=True)
+class MortgageStrategy(OwnerStrategy):
+    """Concrete strategy for owning with mortgage."""
+
+    name = "Mortgage"
 
     house_value: float
-    preselling_down_payment: float
-    lump_sum: float
-    loan_down_payment: float
+    down_payment: float
     loan_term_months: int
     loan_interest_rate: float
     property_tax_rate: float
     maintenance_cost_rate: float
 
-    # Non-init fields
-    month: int = field(init=False, default=0)
-    owned: bool = field(init=False, default=False)
-    ammortization: float = field(init=False, default=0)
-    property_tax: float = field(init=False, default=0)
-    maintenance_cost: float = field(init=False, default=0)
-    principal: float = field(init=False, default=0)
-    ammortization_schedule: Optional[pd.DataFrame] = field(init=False, default=None)
+    @property
+    def payment_months(self) -> int:
+        return self.loan_term_months + 1
 
-    def __post_init__(self):
-        self.name = "Preselling"
-        Print.print_dict("Housing Values", self.__dict__)
-        print()
+    def loan_principal(self) -> float:
+        return self.house_value - self.down_payment
 
-    def calculate_housing_cost(self) -> float:
-        return self.ammortization + self.property_tax + self.maintenance_cost
+    def ammortization_array(self, months: int) -> np.ndarray:
+        month = np.arange(months)
+        return np.select(
+            [month == 0, month <= self.loan_term_months],
+            [self.down_payment, self.monthly_payment],
+            default=0,
+        )
 
-    def set_yearly_cost(self):
-        if self.owned:
-            self.property_tax = (self.house_value * self.property_tax_rate) / 12
-            self.maintenance_cost = (self.house_value * self.maintenance_cost_rate) / 12
-        else:
-            self.property_tax = 0
-            self.maintenance_cost = 0
 
-    def create_ammortization_schedule(self) -> None:
-        self.ammortization_schedule = calculate_ammortization_schedule(
-            principal=self.principal,
-            annual_rate=self.loan_interest_rate,
-            years=self.loan_term_months / 12,
-        )
+@dataclass(slots=True)
+class PresellingStrategy(OwnerStrategy):
+    """Concrete strategy for owning with preselling."""
 
-    def set_ammortization(self):
-        if self.month > (60 + self.loan_term_months + 1):
-            self.ammortization = 0
-        elif self.month == 0:
-            self.ammortization = self.preselling_down_payment
-        elif self.month <= 24:
-            self.ammortization = 52513.87
-        elif self.month <= 48:
-            self.ammortization = 73519.42
-        elif self.month <= 60:
-            self.ammortization = 168044.39
-        elif self.month == 61:
-            self.ammortization = self.loan_down_payment + 1260332.95
-            self.principal = self.lump_sum
-            self.create_ammortization_schedule()
-            self.owned = True
-        elif self.month > 61:
-            self.ammortization = self.ammortization_schedule.monthly_payment[0]
+    name = "Preselling"
+    turnover_month = 61
 
-        self.month += 1
+    house_value: float
+    preselling_down_payment: float
+    lump_sum: float
+    loan_down_payment: float
+    loan_term_months: int
+    loan_interest_rate: float
+    property_tax_rate: float
+    maintenance_cost_rate: float
 
-    def increase_house_value(self, percentage: float):
-        self.house_value += self.house_value * percentage
+    @property
+    def payment_months(self) -> int:
+        return self.turnover_month + self.loan_term_months + 1
+
+    def loan_principal(self) -> float:
+        return self.lump_sum
+
+    def ammortization_array(self, months: int) -> np.ndarray:
+        month = np.arange(months)
+        return np.select(
+            [
+                month == 0,
+                month <= 24,
+                month <= 48,
+                month <= 60,
+                month == self.turnover_month,
+                month <= self.turnover_month + self.loan_term_months,
+            ],
+            [
+                self.preselling_down_payment,
+                52513.87,
+                73519.42,
+                168044.39,
+                self.loan_down_payment + 1260332.95,
+                self.monthly_payment,
+            ],
+            default=0,
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class RentStrategy(HousingStrategy):
     """Concrete strategy for renting."""
 
+    name = "Rent"
+    house_value = 0
+
     rent: float
+    verbose: InitVar[bool] = field(default=False, kw_only=True)
 
-    def __post_init__(self):
-        self.name = "Rent"
-        Print.print_dict("Housing Values", self.__dict__)
-        print()
+    def __post_init__(self, verbose: bool):
+        if verbose:
+            self.print_values()
 
     def calculate_housing_cost(self) -> float:
         return self.rent
@@ -173,8 +260,19 @@ class RentStrategy(HousingStrategy):
     def increase_rent(self, percentage: float):
         self.rent += self.rent * percentage
 
+    def update_annual(self, house_value_increase: float, rent_increase: float):
+        self.increase_rent(rent_increase)
+
+    def step_month(self):
+        pass
+
+    def cost_schedule(
+        self, months: int, house_value_increase: float, rent_increase: float
+    ) -> np.ndarray:
+        return self.rent * annual_growth(rent_increase, months)
+
 
-def main():
+def main(verbose: bool = False):
     # Example values for different strategies
 
     # Mortgage example - PHP 23000000 house
@@ -185,6 +283,7 @@ def main():
         loan_interest_rate=0.09,  # 6.5% interest rate
         property_tax_rate=0.02,  # 1% property tax
         maintenance_cost_rate=0.01,  # 1% maintenance cost
+        verbose=verbose,
     )
 
     # Preselling example - PHP 450,000 house
@@ -197,46 +296,54 @@ def main():
         loan_interest_rate=0.09,  # 6.5% interest rate
         property_tax_rate=0.02,  # 1% property tax
         maintenance_cost_rate=0.01,  # 1% maintenance cost
+        verbose=verbose,
     )
 
     # Rent example - PHP 2,500 monthly rent
-    rent_strategy = RentStrategy(rent=90000.0)
-
-    # Simulate costs for first year (12 months)
-    print("\nMonthly costs for first year:")
-    print("-" * 50)
+    rent_strategy = RentStrategy(rent=90000.0, verbose=verbose)
 
     strategies = [mortgage_strategy, preselling_strategy, rent_strategy]
 
+    # Simulate costs for first year (12 months)
+    lines = []
+    if verbose:
+        lines += ["\nMonthly costs for first year:", "-" * 50]
+
     for month in range(36):
-        print(f"\nMonth {month + 1}")
+        if verbose:
+            lines.append(f"\nMonth {month + 1}")
         for strategy in strategies:
             # Update monthly costs
-            if isinstance(strategy, (MortgageStrategy, PresellingStrategy)):
-                strategy.set_yearly_cost()
-                strategy.set_ammortization()
+            strategy.step_month()
 
             # Calculate and display monthly cost
-            monthly_cost = strategy.calculate_housing_cost()
-            print(f"{strategy.name}: PHP {monthly_cost:,.2f}")
+            if verbose:
+                monthly_cost = strategy.calculate_housing_cost()
+                lines.append(f"{strategy.name}: PHP {monthly_cost:,.2f}")
+
+    # The rest of the demo only builds the report
+    if not verbose:
+        return
 
     # Simulate property value increase (3% annual appreciation)
-    print("\nProperty value after 3% annual appreciation:")
-    print("-" * 50)
+    lines += ["\nProperty value after 3% annual appreciation:", "-" * 50]
     for strategy in strategies:
-        if isinstance(strategy, (MortgageStrategy, PresellingStrategy)):
+        if isinstance(strategy, OwnerStrategy):
             original_value = strategy.house_value
             strategy.increase_house_value(0.03)
-            print(
+            lines.append(
                 f"{strategy.name}: PHP {original_value:,.2f} → PHP {strategy.house_value:,.2f}"
             )
         elif isinstance(strategy, RentStrategy):
             original_rent = strategy.rent
             strategy.increase_rent(0.03)
-            print(
+            lines.append(
                 f"{strategy.name}: PHP {original_rent:,.2f} → PHP {strategy.rent:,.2f}"
             )
 
+    # Write the report in one go instead of once per line
+    print("\n".join(lines))
+
 
 if __name__ == "__main__":
-    main()
+    main(verbose=True)
@@ -1,56 +1,77 @@
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 
 from visualizer import Print
 
 
-def calculate_ammortization_schedule(principal, annual_rate, years) -> pd.DataFrame:
+@lru_cache(maxsize=128)
+def calculate_annuity_factor(annual_rate, years) -> float:
     monthly_rate = annual_rate / 12
     total_payments = years * 12
-    monthly_payment = (
-        principal * monthly_rate / (1 - (1 + monthly_rate) ** -total_payments)
-    )
+    return monthly_rate / (1 - (1 + monthly_rate) ** -total_payments)
 
-    schedule = []
-    cashout = 0
-    balance = principal
 
-    for i in range(1, int(total_payments) + 1):
-        interest = balance * monthly_rate
-        principal_payment = monthly_payment - interest
-        balance -= principal_payment
+def calculate_monthly_payment(principal, annual_rate, years) -> float:
+    return principal * calculate_annuity_factor(annual_rate, years)
 
-        schedule.append(
-            {
-                "month": i,
-                "monthly_payment": round(monthly_payment, 3),
-                "interest": round(interest, 3),
-                "principal": round(principal_payment, 3),
-                "remaining_balance": round(balance, 3),
-            }
-        )
-        cashout += monthly_payment
 
-    stats = {
-        "total principal": principal,
-        "total cashout for loan": cashout,
-        "monthly payment": monthly_payment,
-    }
+@lru_cache(maxsize=128)
+def _build_ammortization_schedule(principal, annual_rate, years) -> pd.DataFrame:
+    monthly_rate = annual_rate / 12
+    total_payments = years * 12
+    monthly_payment = calculate_monthly_payment(principal, annual_rate, years)
 
-    Print.print_dict("Bank Loan Details", stats)
-    print()
+    # Remaining balance after each payment, from the annuity closed form
+    month = np.arange(1, int(total_payments) + 1)
+    growth = (1 + monthly_rate) ** month
+    remaining_balance = (
+        principal * growth - monthly_payment * (growth - 1) / monthly_rate
+    )
+    interest = np.concatenate(([principal], remaining_balance[:-1])) * monthly_rate
 
-    return pd.DataFrame(schedule)
+    return pd.DataFrame(
+        {
+            "month": month,
+            "monthly_payment": monthly_payment,
+            "interest": interest,
+            "principal": monthly_payment - interest,
+            "remaining_balance": remaining_balance,
+        }
+    )
 
 
-def main():
+def calculate_ammortization_schedule(
+    principal, annual_rate, years, verbose: bool = False
+) -> pd.DataFrame:
+    schedule = _build_ammortization_schedule(principal, annual_rate, years)
+
+    if verbose:
+        monthly_payment = calculate_monthly_payment(principal, annual_rate, years)
+        stats = {
+            "total principal": principal,
+            "total cashout for loan": monthly_payment * len(schedule),
+            "monthly payment": monthly_payment,
+        }
+        Print.print_dict("Bank Loan Details", stats)
+        print()
+
+    # The cached frame is shared, so hand out a copy
+    return schedule.copy()
+
+
+def main(verbose: bool = False):
     principal = 6000000
     annual_rate = 0.09
     years = 20
 
-    schedule = calculate_ammortization_schedule(principal, annual_rate, years)
+    schedule = calculate_ammortization_schedule(
+        principal, annual_rate, years, verbose=verbose
+    )
 
     return schedule
 
 
 if __name__ == "__main__":
-    schedule = main()
+    schedule = main(verbose=True)
@@ -1,16 +1,31 @@
 # investment_strategy.py
 
+import math
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
+
+from visualizer import timeline_template
+
+RISK_MULTIPLIERS = {"conservative": 0.7, "moderate": 1.0, "aggressive": 1.3}
+
+
+@lru_cache(maxsize=1024)
+def _annualized_to_monthly(annual_rate: float) -> float:
+    """Monthly rate that compounds to the given annual rate."""
+    return math.expm1(math.log1p(annual_rate) / 12)
 
 
 class InvestmentStrategy(ABC):
     """Abstract base class for investment strategies."""
 
+    __slots__ = ()
+
     @abstractmethod
     def calculate_monthly_return(self, current_investment: float) -> float:
         """Calculate monthly return based on current investment amount."""
@@ -21,46 +36,91 @@ class InvestmentStrategy(ABC):
         """Get the monthly growth multiplier."""
         pass
 
+    @abstractmethod
+    def get_monthly_return_rate(self) -> float:
+        """Get the monthly return rate."""
+        pass
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BasicInvestmentStrategy(InvestmentStrategy):
     """Simple investment strategy with fixed annual return rate."""
 
     annual_return_rate: float
+    monthly_return_rate: float = field(init=False, repr=False)
+    growth_factor: float = field(init=False, repr=False)
 
     def __post_init__(self):
         """Convert annual rate to monthly rate using compound interest formula."""
-        self.monthly_return_rate = (1 + self.annual_return_rate) ** (1 / 12) - 1
+        monthly_return_rate = _annualized_to_monthly(self.annual_return_rate)
+        object.__setattr__(self, "monthly_return_rate", monthly_return_rate)
+        object.__setattr__(self, "growth_factor", 1 + monthly_return_rate)
 
     def calculate_monthly_return(self, current_investment: float) -> float:
         return current_investment * self.monthly_return_rate
 
     def get_monthly_growth_factor(self) -> float:
-        return 1 + self.monthly_return_rate
+        return self.growth_factor
 
+    def get_monthly_return_rate(self) -> float:
+        return self.monthly_return_rate
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class RiskAdjustedStrategy(InvestmentStrategy):
     """Investment strategy that considers risk levels and adjusts returns accordingly."""
 
     base_return_rate: float
     risk_level: str  # 'conservative', 'moderate', or 'aggressive'
+    monthly_return_rate: float = field(init=False, repr=False)
+    growth_factor: float = field(init=False, repr=False)
 
     def __post_init__(self):
-        risk_multipliers = {"conservative": 0.7, "moderate": 1.0, "aggressive": 1.3}
-        adjusted_rate = self.base_return_rate * risk_multipliers[self.risk_level]
-        self.monthly_return_rate = (1 + adjusted_rate) ** (1 / 12) - 1
+        adjusted_rate = self.base_return_rate * RISK_MULTIPLIERS[self.risk_level]
+        monthly_return_rate = _annualized_to_monthly(adjusted_rate)
+        object.__setattr__(self, "monthly_return_rate", monthly_return_rate)
+        object.__setattr__(self, "growth_factor", 1 + monthly_return_rate)
 
     def calculate_monthly_return(self, current_investment: float) -> float:
         return current_investment * self.monthly_return_rate
 
     def get_monthly_growth_factor(self) -> float:
-        return 1 + self.monthly_return_rate
+        return self.growth_factor
+
+    def get_monthly_return_rate(self) -> float:
+        return self.monthly_return_rate
+
+
+def _simulate_kernel(
+    initial: float, monthly_rate: float, months: int, contribution: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Value, return and total contributed for each month of a fixed-rate investment."""
+    month = np.arange(1, months + 1)
+
+    # value[n] = value[n - 1] * growth + contribution, solved in closed form.
+    # log1p/expm1 keep tiny rates from rounding away in 1 + rate.
+    log_growth = month * np.log1p(monthly_rate)
+    compounding = np.exp(log_growth)
+    if monthly_rate == 0:
+        accumulated = month * contribution
+    else:
+        accumulated = contribution * np.expm1(log_growth) / monthly_rate
+    values = initial * compounding + accumulated
+
+    # Return is earned on the value before this month's growth and contribution
+    previous_values = np.concatenate(([initial], values))[:-1]
+    returns = previous_values * monthly_rate
+    contributions = initial + contribution * month
+
+    return values, returns, contributions
 
 
 class InvestmentSimulator:
     """Simulator for running investment scenarios."""
 
+    # Set to np.float32 to halve the frame size when cents do not matter
+    OUTPUT_DTYPE = np.float64
+
     def __init__(self, initial_investment: float, strategy: InvestmentStrategy):
         self.initial_investment = initial_investment
         self.strategy = strategy
@@ -69,24 +129,12 @@ class InvestmentSimulator:
         self, months: int, monthly_contribution: float = 0
     ) -> pd.DataFrame:
         """Simulate investment growth over time with optional monthly contributions."""
-        investment_value = self.initial_investment
-        values = []
-        returns = []
-        contributions = []
-        total_invested = self.initial_investment
-
-        for month in range(months):
-            # Calculate return before adding new contribution
-            monthly_return = self.strategy.calculate_monthly_return(investment_value)
-            investment_value += monthly_return
-
-            # Add monthly contribution
-            investment_value += monthly_contribution
-            total_invested += monthly_contribution
-
-            values.append(investment_value)
-            returns.append(monthly_return)
-            contributions.append(total_invested)
+        values, returns, contributions = _simulate_kernel(
+            initial=self.initial_investment,
+            monthly_rate=self.strategy.get_monthly_return_rate(),
+            months=months,
+            contribution=monthly_contribution,
+        )
 
         return pd.DataFrame(
             {
@@ -94,63 +142,67 @@ class InvestmentSimulator:
                 "monthly_return": returns,
                 "total_contributed": contributions,
             },
-            index=range(1, months + 1),
+            index=pd.RangeIndex(1, months + 1, name="Month"),
+            dtype=self.OUTPUT_DTYPE,
+            copy=False,
         )
 
     def plot_growth(self, df: pd.DataFrame, title: str = "Investment Growth Over Time"):
-        """Plot the investment growth over time using Plotly Express."""
-        # Prepare data for plotting
-        plot_df = df.reset_index()
-        plot_df.columns = [
-            "Month",
-            "Total Value",
-            "Monthly Return",
-            "Total Contributed",
-        ]
-
-        fig = px.line(
-            plot_df,
-            x="Month",
-            y=["Total Value", "Total Contributed"],
-            title=title,
-            labels={"value": "Value (PHP)", "variable": "Metric"},
-            template="plotly_white",
+        """Plot the investment growth over time with WebGL line traces."""
+        fig = go.Figure(
+            layout=dict(
+                template=timeline_template(),
+                title=title,
+                xaxis_title="Month",
+                yaxis_title="Value (PHP)",
+            )
         )
-
-        # Customize the layout
-        fig.update_layout(
-            hovermode="x unified",
-            legend_title_text="",
-            xaxis_title="Month",
-            yaxis_title="Value (PHP)",
-            showlegend=True,
+        fig.add_trace(
+            go.Scattergl(
+                x=df.index, y=df["total_value"], mode="lines", name="Total Value"
+            )
+        )
+        fig.add_trace(
+            go.Scattergl(
+                x=df.index,
+                y=df["total_contributed"],
+                mode="lines",
+                name="Total Contributed",
+            )
         )
 
         return fig
 
 
 def prepare_comparison_data(results: Dict[str, pd.DataFrame]) -> pd.DataFrame:
-    """Prepare data for strategy comparison visualization."""
-    comparison_data = []
+    """Stack strategy results into one long table for export or comparison."""
+    total = sum(len(df) for df in results.values())
+    comparison_data = {
+        "Month": np.empty(total, dtype=np.int64),
+        "Total Value": np.empty(total),
+        "Monthly Return": np.empty(total),
+        "Total Contributed": np.empty(total),
+        "Strategy": np.empty(total, dtype=object),
+    }
 
+    # Fill each strategy's rows in place instead of concatenating frames
+    offset = 0
     for strategy_name, df in results.items():
-        temp_df = df.reset_index()
-        temp_df["Strategy"] = strategy_name
-        temp_df.columns = [
-            "Month",
-            "Total Value",
-            "Monthly Return",
-            "Total Contributed",
-            "Strategy",
-        ]
-        comparison_data.append(temp_df)
+        rows = slice(offset, offset + len(df))
+        comparison_data["Month"][rows] = df.index
+        comparison_data["Total Value"][rows] = df["total_value"]
+        comparison_data["Monthly Return"][rows] = df["monthly_return"]
+        comparison_data["Total Contributed"][rows] = df["total_contributed"]
+        comparison_data["Strategy"][rows] = strategy_name
+        offset += len(df)
 
-    return pd.concat(comparison_data, axis=0)
+    return pd.DataFrame(comparison_data)
 
 
-def main():
+def main(verbose: bool = False):
     # Example usage with different strategies
-    print("Investment Growth Simulation\n")
+    if verbose:
+        print("Investment Growth Simulation\n")
 
     # Basic strategy example
     basic_strategy = BasicInvestmentStrategy(
@@ -188,39 +240,37 @@ def main():
             monthly_contribution=500,
         )
 
-        final_value = results[name]["total_value"].iloc[-1]
-        total_contributed = results[name]["total_contributed"].iloc[-1]
-        total_return = final_value - total_contributed
-
-        print(f"\n{name} Strategy Results:")
-        print(f"Final Value: PHP{final_value:,.2f}")
-        print(f"Total Contributed: PHP{total_contributed:,.2f}")
-        print(f"Total Return: PHP{total_return:,.2f}")
-        print(f"Return Percentage: {(total_return/total_contributed)*100:.1f}%")
-
-    # Create comparison visualization
-    comparison_df = prepare_comparison_data(results)
-    fig = px.line(
-        comparison_df,
-        x="Month",
-        y="Total Value",
-        color="Strategy",
-        title="Investment Strategy Comparison",
-        labels={"Total Value": "Value (PHP)"},
-        template="plotly_white",
-    )
-
-    fig.update_layout(
-        hovermode="x unified",
-        legend_title_text="Strategy",
-        xaxis_title="Month",
-        yaxis_title="Value (PHP)",
-        showlegend=True,
+        if verbose:
+            final_value = results[name]["total_value"].iloc[-1]
+            total_contributed = results[name]["total_contributed"].iloc[-1]
+            total_return = final_value - total_contributed
+
+            print(f"\n{name} Strategy Results:")
+            print(f"Final Value: PHP{final_value:,.2f}")
+            print(f"Total Contributed: PHP{total_contributed:,.2f}")
+            print(f"Total Return: PHP{total_return:,.2f}")
+            print(f"Return Percentage: {(total_return/total_contributed)*100:.1f}%")
+
+    # Create comparison visualization, one trace per strategy
+    fig = go.Figure(
+        layout=dict(
+            template=timeline_template(),
+            title="Investment Strategy Comparison",
+            xaxis_title="Month",
+            yaxis_title="Value (PHP)",
+            legend_title_text="Strategy",
+        )
     )
+    for name, result in results.items():
+        fig.add_trace(
+            go.Scattergl(
+                x=result.index, y=result["total_value"], mode="lines", name=name
+            )
+        )
 
     # Show the plot
     fig.show()
 
 
 if __name__ == "__main__":
-    main()
+    main(verbose=True)
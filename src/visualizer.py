@@ -1,4 +1,25 @@
-import plotly.express as px
+from functools import lru_cache
+
+# Shared layout for the timeline plots
+FINANCE_TIMELINE = "finance_timeline"
+
+
+@lru_cache(maxsize=None)
+def timeline_template() -> str:
+    """Register the timeline template on first use and return its name."""
+    # Plotly is imported here so modules that only print do not load it
+    import plotly.graph_objects as go
+    import plotly.io as pio
+
+    template = go.layout.Template(pio.templates["plotly"])
+    template.layout.update(
+        title="Finance Timeline",
+        xaxis_title="month",
+        yaxis_title="pesos",
+        hovermode="x unified",  # Ensures that hover information for the same x is shown for both traces
+    )
+    pio.templates[FINANCE_TIMELINE] = template
+    return FINANCE_TIMELINE
 
 
 class Plots:
@@ -6,15 +27,13 @@ class Plots:
 
     @staticmethod
     def plot_net_worth(cashflow) -> None:
+        import plotly.express as px
+
         plt = px.line(
             cashflow,
             y=["net_worth", "investments", "house_value", "housing_cost", "cashflow"],
-        )
-        plt.update_layout(
-            title="Finance Timeline",
-            xaxis_title="month",
-            yaxis_title="pesos",
-            hovermode="x unified",  # Ensures that hover information for the same x is shown for both traces
+            labels={"value": "pesos"},
+            template=timeline_template(),
         )
         plt.show()
 
@@ -24,14 +43,17 @@ class Print:
 
     @staticmethod
     def print_dict(title: str, stats: dict) -> None:
-        max_key_width = max(len(key) for key in stats.keys())
+        keys = list(stats)
+        max_key_width = max(map(len, keys))
 
-        print(f"{title}:")
-        for key, (value) in stats.items():
+        # Buffer the rows and write them with a single print
+        rows = [f"{title}:"]
+        for key, value in stats.items():
             try:
-                print(f"{key:{max_key_width}} : {value:{15},.2f}")
+                rows.append(f"{key:{max_key_width}} : {value:{15},.2f}")
             except ValueError:
-                print(f"{key:{max_key_width}} : {str(value):>{15}}")
+                rows.append(f"{key:{max_key_width}} : {str(value):>{15}}")
+        print("\n".join(rows))
 
     # @staticmethod
     # def print_arguments(func):
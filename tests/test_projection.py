@@ -0,0 +1,361 @@
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from BudgetCalculator import BudgetCalculator, FinancialStrategy  # noqa: E402
+from housing import MortgageStrategy, PresellingStrategy, RentStrategy  # noqa: E402
+from interest import calculate_ammortization_schedule  # noqa: E402
+from investment import (  # noqa: E402
+    BasicInvestmentStrategy,
+    InvestmentSimulator,
+    RiskAdjustedStrategy,
+)
+
+RTOL = 1e-9
+
+
+def loop_payment(principal, annual_rate, years):
+    monthly_rate = annual_rate / 12
+    return principal * monthly_rate / (1 - (1 + monthly_rate) ** -(years * 12))
+
+
+def loop_housing_costs(housing, months, house_value_increase, rent_increase):
+    """Monthly housing cost and house value, stepped like the original loop."""
+    costs, values = [], []
+    house_value = getattr(housing, "house_value", 0)
+    rent = getattr(housing, "rent", 0)
+    payment = 0
+
+    for month in range(months):
+        if month > 0 and month % 12 == 0:
+            house_value += house_value * house_value_increase
+            rent += rent * rent_increase
+
+        if isinstance(housing, RentStrategy):
+            costs.append(rent)
+            values.append(0)
+            continue
+
+        if isinstance(housing, MortgageStrategy):
+            turnover = 0
+            if month == 0:
+                ammortization = housing.down_payment
+                payment = loop_payment(
+                    housing.house_value - housing.down_payment,
+                    housing.loan_interest_rate,
+                    housing.loan_term_months / 12,
+                )
+            elif month <= housing.loan_term_months:
+                ammortization = payment
+            else:
+                ammortization = 0
+        else:
+            turnover = 61
+            if month == 0:
+                ammortization = housing.preselling_down_payment
+            elif month <= 24:
+                ammortization = 52513.87
+            elif month <= 48:
+                ammortization = 73519.42
+            elif month <= 60:
+                ammortization = 168044.39
+            elif month == 61:
+                ammortization = housing.loan_down_payment + 1260332.95
+                payment = loop_payment(
+                    housing.lump_sum,
+                    housing.loan_interest_rate,
+                    housing.loan_term_months / 12,
+                )
+            elif month <= 61 + housing.loan_term_months:
+                ammortization = payment
+            else:
+                ammortization = 0
+
+        yearly_rate = housing.property_tax_rate + housing.maintenance_cost_rate
+        owned_cost = house_value * yearly_rate / 12 if month >= turnover else 0
+        costs.append(ammortization + owned_cost)
+        values.append(house_value)
+
+    return costs, values
+
+
+def loop_projection(calculator, savings, investments, months, increases):
+    """Port of the original month-by-month calculate_financial_projection."""
+    income_increase, expense_increase, house_value_increase = increases
+    strategy = calculator.financial_strategy
+    housing_costs, house_values = loop_housing_costs(
+        strategy.housing_strategy, months, house_value_increase, expense_increase
+    )
+    income = calculator.calculate_total_income()
+    expenses = calculator.daily_living_expense + calculator.other_expenses
+
+    rows = []
+    for month in range(months):
+        if month > 0 and month % 12 == 0:
+            income += income * income_increase
+            expenses += expenses * expense_increase
+
+        budget = income - expenses - housing_costs[month]
+        investment_return = strategy.investment_strategy.calculate_monthly_return(
+            investments
+        )
+        investments += investment_return
+        if budget >= 0:
+            savings += budget * strategy.savings_rate
+            investments += budget * strategy.investments_rate
+        else:
+            investments += budget
+
+        rows.append(
+            [
+                savings + investments + house_values[month],
+                budget,
+                investments,
+                investment_return,
+                savings,
+            ]
+        )
+
+    return np.array(rows)
+
+
+class ProjectionMatchesLoopTest(unittest.TestCase):
+    """The vectorized projection reproduces the original monthly loop."""
+
+    def project(self, housing, salary, months, base_return_rate=0.08):
+        calculator = BudgetCalculator(
+            financial_strategy=FinancialStrategy(
+                housing_strategy=housing,
+                investment_strategy=RiskAdjustedStrategy(
+                    base_return_rate=base_return_rate, risk_level="moderate"
+                ),
+                savings_rate=0.3,
+                investments_rate=0.7,
+            ),
+            salary=salary,
+            other_income=0,
+            daily_living_expenses=50000,
+            other_expenses=0,
+        )
+        increases = (0.07, 0.05, 0.02)
+        projection = calculator.calculate_financial_projection(
+            savings=1000000,
+            investments=4000000,
+            liabilities=0,
+            months=months,
+            income_increase=increases[0],
+            expense_increase=increases[1],
+            house_value_increase=increases[2],
+        )
+        expected = loop_projection(calculator, 1000000, 4000000, months, increases)
+
+        columns = ["net_worth", "cashflow", "investments", "investment_returns"]
+        actual = projection[columns + ["savings"]].to_numpy()
+        np.testing.assert_allclose(actual, expected, rtol=RTOL, atol=1e-6)
+        return projection
+
+    def mortgage(self, loan_term_months=240):
+        return MortgageStrategy(
+            house_value=22506000,
+            down_payment=22506000 * 0.2,
+            loan_term_months=loan_term_months,
+            loan_interest_rate=0.07,
+            property_tax_rate=0.02,
+            maintenance_cost_rate=0.01,
+        )
+
+    def preselling(self, loan_term_months=240):
+        return PresellingStrategy(
+            house_value=22050600,
+            preselling_down_payment=2370665.91,
+            lump_sum=17644661.35,
+            loan_down_payment=17644661.35 * 0.2,
+            loan_term_months=loan_term_months,
+            loan_interest_rate=0.07,
+            property_tax_rate=0.02,
+            maintenance_cost_rate=0.01,
+        )
+
+    def test_mortgage_shorter_than_loan_term(self):
+        self.project(self.mortgage(), salary=300000, months=36)
+
+    def test_mortgage_paid_off_within_projection(self):
+        self.project(self.mortgage(loan_term_months=60), salary=300000, months=120)
+
+    def test_preselling_turnover(self):
+        projection = self.project(self.preselling(), salary=300000, months=120)
+        # Property costs start at turnover, on top of the turnover payment
+        self.assertGreater(
+            projection.housing_cost.iloc[61], projection.housing_cost.iloc[60]
+        )
+
+    def test_preselling_loan_ends_after_turnover(self):
+        self.project(self.preselling(loan_term_months=24), salary=300000, months=120)
+
+    def test_negative_budget_draws_from_investments(self):
+        projection = self.project(self.mortgage(), salary=60000, months=48)
+        self.assertTrue((projection.cashflow < 0).any())
+
+    def test_zero_return_rate(self):
+        projection = self.project(
+            RentStrategy(rent=50000), salary=90000, months=60, base_return_rate=0
+        )
+        self.assertTrue((projection.investment_returns == 0).all())
+
+
+class CostScheduleIsPureTest(unittest.TestCase):
+    """Building a cost schedule leaves the stateful strategy untouched."""
+
+    def test_mortgage_loan_survives_appreciation(self):
+        mortgage = MortgageStrategy(1_000_000, 200_000, 240, 0.07, 0.02, 0)
+        for _ in range(12):
+            mortgage.step_month()
+        mortgage.update_annual(house_value_increase=0.5, rent_increase=0)
+        state = (mortgage.principal, mortgage.monthly_payment, mortgage.month)
+
+        mortgage.cost_schedule(24, 0.02, 0.05)
+
+        self.assertEqual(
+            (mortgage.principal, mortgage.monthly_payment, mortgage.month), state
+        )
+        self.assertEqual(mortgage.principal, 800_000)
+        self.assertAlmostEqual(
+            mortgage.monthly_payment, loop_payment(800_000, 0.07, 20), places=9
+        )
+
+
+class UpdateAnnualTest(unittest.TestCase):
+    """update_annual applies one year of growth to the stateful strategies."""
+
+    def test_owned_house_reprices_yearly_costs(self):
+        mortgage = MortgageStrategy(1_000_000, 200_000, 240, 0.07, 0.02, 0.01)
+        mortgage.update_annual(house_value_increase=0.1, rent_increase=0.5)
+
+        self.assertAlmostEqual(mortgage.house_value, 1_100_000)
+        self.assertAlmostEqual(mortgage.property_tax, 1_100_000 * 0.02 / 12)
+        self.assertAlmostEqual(mortgage.maintenance_cost, 1_100_000 * 0.01 / 12)
+
+    def test_preselling_has_no_yearly_costs_before_turnover(self):
+        preselling = PresellingStrategy(
+            1_000_000, 100_000, 800_000, 160_000, 240, 0.07, 0.02, 0.01
+        )
+        preselling.update_annual(house_value_increase=0.1, rent_increase=0)
+
+        self.assertAlmostEqual(preselling.house_value, 1_100_000)
+        self.assertEqual((preselling.property_tax, preselling.maintenance_cost), (0, 0))
+
+    def test_rent_grows_with_rent_increase(self):
+        rent = RentStrategy(rent=50_000)
+        rent.update_annual(house_value_increase=0.5, rent_increase=0.05)
+
+        self.assertAlmostEqual(rent.calculate_housing_cost(), 52_500)
+
+
+class SteppingMatchesCostScheduleTest(unittest.TestCase):
+    """Stepping a strategy month by month agrees with its cost schedule."""
+
+    MONTHS = 420
+
+    def check(self, make_strategy, house_value_increase=0.03, rent_increase=0.05):
+        expected = make_strategy().cost_schedule(
+            self.MONTHS, house_value_increase, rent_increase
+        )
+
+        strategy = make_strategy()
+        actual = []
+        for month in range(self.MONTHS):
+            if month > 0 and month % 12 == 0:
+                strategy.update_annual(house_value_increase, rent_increase)
+            strategy.step_month()
+            actual.append(strategy.calculate_housing_cost())
+
+        np.testing.assert_allclose(actual, expected, rtol=RTOL, atol=1e-6)
+
+    def test_mortgage_paid_off_within_run(self):
+        self.check(lambda: MortgageStrategy(1_000_000, 200_000, 120, 0.07, 0.02, 0.01))
+
+    def test_preselling_past_turnover_and_loan_end(self):
+        self.check(
+            lambda: PresellingStrategy(
+                22050600,
+                2370665.91,
+                17644661.35,
+                17644661.35 * 0.2,
+                240,
+                0.07,
+                0.02,
+                0.01,
+            )
+        )
+
+    def test_rent(self):
+        self.check(lambda: RentStrategy(rent=50_000))
+
+
+class AmmortizationScheduleMatchesLoopTest(unittest.TestCase):
+    """The closed-form schedule reproduces the original balance loop."""
+
+    def test_schedule(self):
+        principal, annual_rate, years = 6000000, 0.09, 20
+        schedule = calculate_ammortization_schedule(principal, annual_rate, years)
+
+        monthly_rate = annual_rate / 12
+        payment = loop_payment(principal, annual_rate, years)
+        balance = principal
+        rows = []
+        for month in range(1, years * 12 + 1):
+            interest = balance * monthly_rate
+            balance -= payment - interest
+            rows.append([month, payment, interest, payment - interest, balance])
+
+        actual = schedule[
+            ["month", "monthly_payment", "interest", "principal", "remaining_balance"]
+        ].to_numpy()
+        np.testing.assert_allclose(actual, rows, rtol=RTOL, atol=1e-6)
+        self.assertAlmostEqual(schedule.remaining_balance.iloc[-1], 0, places=3)
+
+
+class SimulateGrowthMatchesLoopTest(unittest.TestCase):
+    """The closed-form investment growth reproduces the original loop."""
+
+    def check(self, strategy, months, monthly_contribution, initial=10000):
+        df = InvestmentSimulator(initial, strategy).simulate_growth(
+            months, monthly_contribution
+        )
+
+        value = total = initial
+        rows = []
+        for _ in range(months):
+            monthly_return = strategy.calculate_monthly_return(value)
+            value += monthly_return + monthly_contribution
+            total += monthly_contribution
+            rows.append([value, monthly_return, total])
+
+        self.assertEqual(list(df.index), list(range(1, months + 1)))
+        np.testing.assert_allclose(
+            df.to_numpy(), np.reshape(rows, (months, 3)), rtol=RTOL, atol=1e-6
+        )
+
+    def test_contributions(self):
+        self.check(RiskAdjustedStrategy(0.07, "aggressive"), 120, 500)
+
+    def test_zero_return_rate(self):
+        self.check(BasicInvestmentStrategy(annual_return_rate=0), 120, 500)
+
+    def test_tiny_return_rate(self):
+        strategy = BasicInvestmentStrategy(annual_return_rate=1.2e-11)
+        self.check(strategy, 120, 500, initial=1e12)
+
+    def test_withdrawals(self):
+        self.check(BasicInvestmentStrategy(annual_return_rate=0.07), 60, -300)
+
+    def test_single_month(self):
+        self.check(RiskAdjustedStrategy(0.07, "conservative"), 1, 500)
+
+
+if __name__ == "__main__":
+    unittest.main()